@@ -1,10 +1,11 @@
 import logging
 import google.oauth2.service_account
-import pandas_gbq
+from google.cloud import bigquery
 from googleapiclient.discovery import build
 
 from spaceone.core.connector import BaseConnector
 from plugin.error import *
+from plugin.lib.query_stats import query_cache_stats
 
 _LOGGER = logging.getLogger('spaceone')
 
@@ -18,6 +19,7 @@ class BigqueryConnector(BaseConnector):
         self.project_id = None
         self.credentials = None
         self.google_client = None
+        self.bigquery_client = None
 
     def create_session(self, options: dict, secret_data: dict, schema: str):
         self._check_secret_data(secret_data)
@@ -25,6 +27,7 @@ class BigqueryConnector(BaseConnector):
 
         self.credentials = google.oauth2.service_account.Credentials.from_service_account_info(secret_data)
         self.google_client = build('bigquery', 'v2', credentials=self.credentials)
+        self.bigquery_client = bigquery.Client(project=self.project_id, credentials=self.credentials)
 
     def list_tables(self, billing_export_project_id, dataset_id, **query):
         table_list = []
@@ -41,8 +44,16 @@ class BigqueryConnector(BaseConnector):
 
         return table_list
 
-    def read_df_from_bigquery(self, query):
-        return pandas_gbq.read_gbq(query, project_id=self.project_id, credentials=self.credentials)
+    def read_df_from_bigquery(self, query, query_parameters=None, query_name='query'):
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=query_parameters or [],
+            use_query_cache=True
+        )
+        query_job = self.bigquery_client.query(query, job_config=job_config)
+        df = query_job.to_dataframe(create_bqstorage_client=False)
+
+        query_cache_stats.record(query_name, query_job.cache_hit, query_job.total_bytes_processed)
+        return df
 
     @staticmethod
     def _check_secret_data(secret_data):
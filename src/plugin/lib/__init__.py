@@ -0,0 +1,2 @@
+from plugin.lib.query_builder import QueryBuilder
+from plugin.lib.query_stats import QueryCacheStats, query_cache_stats
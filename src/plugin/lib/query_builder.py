@@ -0,0 +1,96 @@
+import re
+from typing import List, Tuple
+
+from google.cloud import bigquery
+
+from plugin.error import *
+
+# BigQuery cannot bind table names as query parameters, so identifiers are validated instead of escaped
+_PROJECT_ID_PATTERN = re.compile(r'^(?:[a-z0-9.\-]+:)?[a-z][a-z0-9\-]{4,28}[a-z0-9]$')
+_DATASET_TABLE_PATTERN = re.compile(r'^[A-Za-z0-9_]{1,1024}$')
+
+PROJECT_IDS_QUERY = """
+    SELECT DISTINCT project.id
+    FROM {table}
+    WHERE usage_start_time >= TIMESTAMP(@start_date)
+"""
+
+LINKED_ACCOUNTS_QUERY = """
+    SELECT DISTINCT project.id, project.name AS project_name
+    FROM {table}
+    WHERE usage_start_time >= TIMESTAMP(@start_date)
+"""
+
+COST_QUERY = """
+    SELECT
+      TIMESTAMP_TRUNC(usage_start_time, DAY) AS billed_at,
+      billing_account_id,
+      service.description,
+      sku.description AS sku_description,
+      project.id,
+      project.name AS project_name,
+      IFNULL((location.region), 'global') AS region_code,
+      usage.pricing_unit,
+      invoice.month,
+      cost_type,
+      TO_JSON_STRING(labels) AS labels,
+      SUM(cost) + SUM(IFNULL((SELECT SUM(c.amount) FROM UNNEST(credits) c), 0)) AS cost,
+      SUM(usage.amount_in_pricing_units) AS usage_quantity
+    FROM {table}
+    WHERE usage_start_time >= TIMESTAMP(@start_date)
+    {project_condition}
+    GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11
+    ORDER BY billed_at DESC
+"""
+
+PROJECT_CONDITION = 'AND project.id IN UNNEST(@project_ids)'
+
+
+class QueryBuilder:
+    """ Builds canonical, parameterized BigQuery SQL for the billing export table
+
+    The same logical query always yields byte-identical SQL text; only the bound
+    parameters vary. This keeps retried and repeated tasks eligible for BigQuery's
+    cached results and keeps user supplied values out of the SQL text.
+    """
+
+    def __init__(self, billing_export_project_id: str, billing_dataset: str, billing_table: str):
+        self.table = self._make_table_reference(billing_export_project_id, billing_dataset, billing_table)
+
+    def project_ids_query(self, start: str) -> Tuple[str, list]:
+        sql = PROJECT_IDS_QUERY.format(table=self.table)
+        return self.normalize(sql), [self._start_date_parameter(start)]
+
+    def linked_accounts_query(self, start: str) -> Tuple[str, list]:
+        sql = LINKED_ACCOUNTS_QUERY.format(table=self.table)
+        return self.normalize(sql), [self._start_date_parameter(start)]
+
+    def cost_query(self, start: str, project_ids: List[str] = None) -> Tuple[str, list]:
+        parameters = [self._start_date_parameter(start)]
+        project_condition = ''
+
+        if project_ids:
+            project_condition = PROJECT_CONDITION
+            parameters.append(bigquery.ArrayQueryParameter('project_ids', 'STRING', sorted(set(project_ids))))
+
+        sql = COST_QUERY.format(table=self.table, project_condition=project_condition)
+        return self.normalize(sql), parameters
+
+    @staticmethod
+    def normalize(sql: str) -> str:
+        return ' '.join(sql.split())
+
+    @staticmethod
+    def _start_date_parameter(start: str) -> bigquery.ScalarQueryParameter:
+        return bigquery.ScalarQueryParameter('start_date', 'DATE', f'{start}-01')
+
+    @staticmethod
+    def _make_table_reference(billing_export_project_id: str, billing_dataset: str, billing_table: str) -> str:
+        if not _PROJECT_ID_PATTERN.match(billing_export_project_id or ''):
+            raise ERROR_INVALID_PARAMETER(key='billing_export_project_id', reason='invalid project id')
+
+        for key, value in [('billing_dataset_id', billing_dataset), ('billing_table', billing_table)]:
+            if not _DATASET_TABLE_PATTERN.match(value or ''):
+                raise ERROR_INVALID_PARAMETER(key=key, reason='invalid identifier')
+
+        return f'`{billing_export_project_id}.{billing_dataset}.{billing_table}`'
@@ -0,0 +1,42 @@
+import logging
+import threading
+
+_LOGGER = logging.getLogger('spaceone')
+
+
+class QueryCacheStats:
+    """ Counts BigQuery jobs and how many of them were served from the result cache """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.cache_hits = 0
+        self.total_bytes_processed = 0
+
+    def record(self, query_name: str, cache_hit: bool, total_bytes_processed: int = None) -> dict:
+        with self._lock:
+            self.total += 1
+            if cache_hit:
+                self.cache_hits += 1
+            self.total_bytes_processed += total_bytes_processed or 0
+            stats = self._to_dict()
+
+        _LOGGER.info(f'[QueryCacheStats] {query_name} cache_hit: {cache_hit} / '
+                     f'bytes_processed: {total_bytes_processed} / {stats}')
+        return stats
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return self._to_dict()
+
+    def _to_dict(self) -> dict:
+        hit_ratio = self.cache_hits / self.total if self.total else 0.0
+        return {
+            'total': self.total,
+            'cache_hits': self.cache_hits,
+            'hit_ratio': round(hit_ratio, 4),
+            'total_bytes_processed': self.total_bytes_processed
+        }
+
+
+query_cache_stats = QueryCacheStats()
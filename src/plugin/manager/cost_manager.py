@@ -8,6 +8,7 @@ from spaceone.core.error import *
 
 from ..conf.cost_conf import BIGQUERY_TABLE_PREFIX
 from ..connector.bigquery_connector import BigqueryConnector
+from ..lib.query_builder import QueryBuilder
 
 _LOGGER = logging.getLogger('spaceone')
 
@@ -38,8 +39,8 @@ class CostManager(BaseManager):
 
         start_month = self._get_start_month()
 
-        query = self._create_linked_accounts_google_sql(start_month)
-        response_stream = self.bigquery_connector.read_df_from_bigquery(query)
+        query, query_parameters = self._create_linked_accounts_google_sql(start_month)
+        response_stream = self.bigquery_connector.read_df_from_bigquery(query, query_parameters, 'get_linked_accounts')
         for index, row in response_stream.iterrows():
             _LOGGER.debug(f'[get_linked_accounts] row: {row}]')
             if row.id is not None:
@@ -67,8 +68,8 @@ class CostManager(BaseManager):
 
         _LOGGER.debug(f'[get_data] task_options: {task_options} / start: {start})')
 
-        query = self._create_google_sql(start)
-        response_stream = self.bigquery_connector.read_df_from_bigquery(query)
+        query, query_parameters = self._create_google_sql(start)
+        response_stream = self.bigquery_connector.read_df_from_bigquery(query, query_parameters, 'get_data')
         for index, row in response_stream.iterrows():
             yield self._make_cost_data(row)
 
@@ -145,53 +146,17 @@ class CostManager(BaseManager):
             raise ERROR_REQUIRED_PARAMETER(key=f"not found table {bigquery_table_names}")
 
     def _create_google_sql(self, start):
-        where_condition = f"""
-        WHERE usage_start_time >= TIMESTAMP('{start}-01')
-        """
+        project_ids = None
         if self.target_project_id != '*':
-            where_condition += f" AND project.id = '{self.target_project_id}'"
-
-        query = f"""
-            SELECT
-              timestamp_trunc(usage_start_time, DAY) as billed_at,
-              billing_account_id,
-              service.description,
-              sku.description as sku_description,
-              project.id,
-              project.name as project_name,
-              IFNULL((location.region), 'global') as region_code,
-              usage.pricing_unit,
-              invoice.month,
-              cost_type,
-              TO_JSON_STRING(labels) as labels,
-
-              SUM(cost)
-                + SUM(IFNULL((SELECT SUM(c.amount)
-                              FROM UNNEST(credits) c), 0))
-                AS cost,
-
-              SUM(usage.amount_in_pricing_units) as usage_quantity,
-            FROM `{self.billing_export_project_id}.{self.billing_dataset}.{self.billing_table}`
-            {where_condition}
-            GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11
-            ORDER BY billed_at desc
-            ;
-        """
-        return query
+            project_ids = [self.target_project_id]
+
+        return self._get_query_builder().cost_query(start, project_ids)
 
     def _create_linked_accounts_google_sql(self, start):
-        where_condition = f"""
-        WHERE usage_start_time >= TIMESTAMP('{start}-01')
-        """
+        return self._get_query_builder().linked_accounts_query(start)
 
-        query = f"""
-            SELECT
-            distinct project.id, project.name as project_name
-            FROM `{self.billing_export_project_id}.{self.billing_dataset}.{self.billing_table}`
-            {where_condition}
-            ;
-        """
-        return query
+    def _get_query_builder(self):
+        return QueryBuilder(self.billing_export_project_id, self.billing_dataset, self.billing_table)
 
     @staticmethod
     def _change_datetime_to_string(date_time):
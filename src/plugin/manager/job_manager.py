@@ -6,6 +6,7 @@ from spaceone.core.manager import BaseManager
 
 from ..conf.cost_conf import BIGQUERY_TABLE_PREFIX
 from ..connector.bigquery_connector import BigqueryConnector
+from ..lib.query_builder import QueryBuilder
 
 
 _LOGGER = logging.getLogger('spaceone')
@@ -45,8 +46,8 @@ class JobManager(BaseManager):
 
         start_month = self._get_start_month(start, last_synchronized_at)
 
-        query = self._create_google_sql(start_month)
-        response_stream = self.bigquery_connector.read_df_from_bigquery(query)
+        query, query_parameters = self._create_google_sql(start_month)
+        response_stream = self.bigquery_connector.read_df_from_bigquery(query, query_parameters, 'get_tasks')
 
         for index, row in response_stream.iterrows():
             tasks.append(
@@ -105,15 +106,7 @@ class JobManager(BaseManager):
             raise ERROR_REQUIRED_PARAMETER(key=f"not found table {bigquery_table_names}")
 
     def _create_google_sql(self, start):
-        where_condition = f"""
-        WHERE usage_start_time >= TIMESTAMP('{start}-01')
-        """
-
-        query = f"""
-            SELECT
-            distinct project.id
-            FROM `{self.billing_export_project_id}.{self.billing_dataset}.{self.billing_table}`
-            {where_condition}
-            ;
-        """
-        return query
+        return self._get_query_builder().project_ids_query(start)
+
+    def _get_query_builder(self):
+        return QueryBuilder(self.billing_export_project_id, self.billing_dataset, self.billing_table)
@@ -35,7 +35,9 @@ setup(
         'spaceone-api',
         'spaceone-cost-analysis',
         'google-api-python-client',
-        'pandas-gbq',
+        'pandas',
+        'db-dtypes',
+        'google-cloud-bigquery',
         'tqdm'
     ],
     zip_safe=False,
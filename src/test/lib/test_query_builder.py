@@ -0,0 +1,65 @@
+import unittest
+
+from plugin.error import *
+from plugin.lib.query_builder import QueryBuilder
+
+
+class TestQueryBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.query_builder = QueryBuilder('billing-export-project', 'billing_dataset',
+                                          'gcp_billing_export_v1_000000_000000')
+
+    def test_cost_query_sql_is_identical_across_parameters(self):
+        sql_1, parameters_1 = self.query_builder.cost_query('2023-01', ['project-a'])
+        sql_2, parameters_2 = self.query_builder.cost_query('2024-06', ['project-b', 'project-c'])
+
+        self.assertEqual(sql_1, sql_2)
+        self.assertNotEqual(parameters_1, parameters_2)
+
+    def test_cost_query_project_ids_are_canonical(self):
+        _, parameters_1 = self.query_builder.cost_query('2023-01', ['project-b', 'project-a', 'project-b'])
+        _, parameters_2 = self.query_builder.cost_query('2023-01', ['project-a', 'project-b'])
+
+        self.assertEqual(parameters_1, parameters_2)
+        self.assertEqual(parameters_1[1].values, ['project-a', 'project-b'])
+
+    def test_cost_query_project_condition(self):
+        sql, parameters = self.query_builder.cost_query('2023-01', ['project-a'])
+        self.assertIn('@project_ids', sql)
+        self.assertEqual(len(parameters), 2)
+
+        sql, parameters = self.query_builder.cost_query('2023-01')
+        self.assertNotIn('@project_ids', sql)
+        self.assertEqual(len(parameters), 1)
+
+    def test_start_date_parameter(self):
+        _, parameters = self.query_builder.project_ids_query('2023-01')
+
+        self.assertEqual(parameters[0].name, 'start_date')
+        self.assertEqual(parameters[0].type_, 'DATE')
+        self.assertEqual(parameters[0].value, '2023-01-01')
+
+    def test_normalize(self):
+        self.assertEqual(QueryBuilder.normalize('\n  SELECT  a,\n\tb\n  FROM t \n'), 'SELECT a, b FROM t')
+
+    def test_table_reference(self):
+        sql, _ = self.query_builder.linked_accounts_query('2023-01')
+        self.assertIn('FROM `billing-export-project.billing_dataset.gcp_billing_export_v1_000000_000000`', sql)
+
+    def test_invalid_table_reference(self):
+        invalid_references = [
+            ('p`; DROP', 'billing_dataset', 'billing_table'),
+            ('billing-export-project', 'billing-dataset`', 'billing_table'),
+            ('billing-export-project', 'billing_dataset', 'billing_table; DROP TABLE x'),
+            ('billing-export-project', '', 'billing_table'),
+        ]
+
+        for project_id, dataset, table in invalid_references:
+            with self.subTest(project_id=project_id, dataset=dataset, table=table):
+                with self.assertRaises(ERROR_INVALID_PARAMETER):
+                    QueryBuilder(project_id, dataset, table)
+
+
+if __name__ == '__main__':
+    unittest.main()